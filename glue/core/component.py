@@ -620,7 +620,11 @@ class ExtendedComponent(Component):
         If center_comp_ids is not a list of length 1 or 2
     """
     def __init__(self, data, center_comp_ids, units=None):
-        if not all(isinstance(s, shapely.Geometry) for s in data):
+        if isinstance(data, np.ndarray) and data.dtype == object and data.ndim == 1:
+            valid = shapely.is_geometry(data).all()
+        else:
+            valid = all(isinstance(s, shapely.Geometry) for s in data)
+        if not valid:
             raise TypeError(
                 "Input data for a ExtendedComponent should be a list of shapely.Geometry objects"
             )
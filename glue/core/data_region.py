@@ -5,11 +5,44 @@ from glue.core.data import Data
 from glue.core.contracts import contract
 
 from glue.core.component import Component, ExtendedComponent
+from glue.core.component_id import ComponentID
 
 
 __all__ = ['RegionData']
 
 
+def _as_geometry_array(component):
+    """
+    Return ``component`` as an object array if it is an array-like of
+    ``shapely.Geometry`` objects, and `None` otherwise.
+
+    Empty inputs are treated as (empty) geometry arrays. Only the first
+    element is checked in Python; the rest are checked with
+    :func:`shapely.is_geometry` once the input has been converted to an
+    object array.
+    """
+    try:
+        first = next(iter(component))
+    except TypeError:
+        return None
+    except StopIteration:
+        return np.asarray(component, dtype=object)
+    if not isinstance(first, shapely.Geometry):
+        return None
+    geoms = np.asarray(component, dtype=object)
+    if geoms.ndim == 1 and shapely.is_geometry(geoms).all():
+        return geoms
+    return None
+
+
+def _representative_centers(geoms):
+    """
+    Return the x and y coordinates of representative points for an array of geometries.
+    """
+    rep_points = shapely.point_on_surface(geoms)
+    return shapely.get_x(rep_points), shapely.get_y(rep_points)
+
+
 class RegionData(Data):
     """
     A glue Data object for storing data that is associated with a region.
@@ -107,21 +140,79 @@ class RegionData(Data):
 
     """
 
+    # Names of the methods used by add_component for the most common exact
+    # types. These are looked up by name so that subclasses can override the
+    # handlers; other types go through _add_fallback.
+    _ADD_DISPATCH = {ExtendedComponent: '_add_extended',
+                     np.ndarray: '_add_possibly_geom',
+                     list: '_add_possibly_geom'}
+
     def __init__(self, label="", coords=None, **kwargs):
         self._extended_component_id = None
+        self._center_x_id = None
+        self._center_y_id = None
+        self._region_tree = None
+        self._equivalent_cid_cache = {}
         # __init__ calls add_component which deals with ExtendedComponent logic
         super().__init__(label=label, coords=coords, **kwargs)
 
     def __repr__(self):
         return f'RegionData (label: {self.label} | extended_component: {self.extended_component_id})'
 
+    @classmethod
+    def from_geometries(cls, geometries, label="", coords=None, boundary_label='boundary'):
+        """
+        Create a :class:`~glue.core.data_region.RegionData` directly from an iterable of geometries.
+
+        This is equivalent to ``RegionData(label=label, coords=coords, **{boundary_label: geometries})``
+        but adds the center and extended components in a single step instead
+        of going through :meth:`add_component` for each of them.
+
+        Parameters
+        ----------
+        geometries : iterable of ``shapely.Geometry``
+            The boundaries of the regions. Iterables that are not sequences,
+            such as generators, are consumed into a list first.
+        label : `str`, optional
+            The label of the data.
+        coords : :class:`~glue.core.coordinates.Coordinates`, optional
+            The coordinates associated with the data.
+        boundary_label : `str`, optional
+            The label of the :class:`~glue.core.component.ExtendedComponent`.
+
+        Raises
+        ------
+        TypeError
+            If geometries is not a one-dimensional iterable of ``shapely.Geometry`` objects
+        """
+        if not hasattr(geometries, '__len__'):
+            geometries = list(geometries)
+        geoms = _as_geometry_array(geometries)
+        if geoms is None:
+            raise TypeError("geometries should be a one-dimensional iterable of shapely.Geometry objects")
+
+        result = cls(label=label, coords=coords)
+        result._create_pixel_and_world_components(ndim=1)
+        result._shape = geoms.shape
+
+        def insert_component(component, cid):
+            # The new object has no hub and no other components yet, so
+            # there are no shape checks or messages to go through
+            if not isinstance(cid, ComponentID):
+                cid = ComponentID(cid, parent=result)
+            result._components[cid] = component
+            return cid
+
+        result._add_geometries(geoms, boundary_label, insert_component)
+        return result
+
     @property
     def center_x_id(self):
-        return self.get_component(self.extended_component_id).x
+        return self._center_x_id
 
     @property
     def center_y_id(self):
-        return self.get_component(self.extended_component_id).y
+        return self._center_y_id
 
     @property
     def extended_component_id(self):
@@ -159,28 +250,143 @@ class RegionData(Data):
            `ValueError`, if the :class:`~glue.core.data_region.RegionData` already has an extended component
         """
 
-        if not isinstance(component, Component):
-            if all(isinstance(s, shapely.Geometry) for s in component):
-                center_x = []
-                center_y = []
-                for s in component:
-                    rep = s.representative_point()
-                    center_x.append(rep.x)
-                    center_y.append(rep.y)
-                cen_x_id = super().add_component(np.asarray(center_x), f"Center [x] for {label}")
-                cen_y_id = super().add_component(np.asarray(center_y), f"Center [y] for {label}")
-                ext_component = ExtendedComponent(np.asarray(component), center_comp_ids=[cen_x_id, cen_y_id])
-                self._extended_component_id = super().add_component(ext_component, label)
-                return self._extended_component_id
+        self._equivalent_cid_cache.clear()
 
+        handler = self._ADD_DISPATCH.get(type(component), '_add_fallback')
+        return getattr(self, handler)(component, label)
+
+    def _add_extended(self, component, label):
+        if self.extended_component_id is not None:
+            raise ValueError(f"Cannot add another ExtendedComponent; existing extended component: {self.extended_component_id}")
+        self._extended_component_id = super().add_component(component, label)
+        self._reset_centers()
+        return self._extended_component_id
+
+    def _add_possibly_geom(self, component, label):
+        geoms = _as_geometry_array(component)
+        if geoms is None:
+            return super().add_component(component, label)
+        return self._add_geometries(geoms, label, super().add_component)
+
+    def _add_geometries(self, geoms, label, add):
+        """
+        Add the center components and the extended component for an array of geometries.
+
+        ``add`` is called as ``add(component, label)`` for each new component
+        and should return the ComponentID it was stored under.
+        """
+        center_x, center_y = _representative_centers(geoms)
+        cen_x_id = add(Component(center_x), f"Center [x] for {label}")
+        cen_y_id = add(Component(center_y), f"Center [y] for {label}")
+        ext_component = ExtendedComponent(geoms, center_comp_ids=[cen_x_id, cen_y_id])
+        self._extended_component_id = add(ext_component, label)
+        self._reset_centers()
+        return self._extended_component_id
+
+    def _add_fallback(self, component, label):
+        # Used for types not in _ADD_DISPATCH, such as subclasses
         if isinstance(component, ExtendedComponent):
-            if self.extended_component_id is not None:
-                raise ValueError(f"Cannot add another ExtendedComponent; existing extended component: {self.extended_component_id}")
-            else:
-                self._extended_component_id = super().add_component(component, label)
-                return self._extended_component_id
-        else:
+            return self._add_extended(component, label)
+        elif isinstance(component, Component):
             return super().add_component(component, label)
+        else:
+            return self._add_possibly_geom(component, label)
+
+    @property
+    def _region_index(self):
+        """
+        A :class:`shapely.STRtree` of the regions in the extended component.
+
+        The tree is built the first time it is needed and rebuilt whenever
+        the geometry array of the extended component is replaced.
+        """
+        if self.extended_component_id is None:
+            raise ValueError("RegionData has no extended component")
+        geoms = self.get_component(self.extended_component_id).data
+        if self._region_tree is None or self._region_tree[0] is not geoms:
+            self._region_tree = (geoms, shapely.STRtree(geoms))
+        return self._region_tree[1]
+
+    def query_point(self, x, y):
+        """
+        Find the regions that contain (or touch) a given point.
+
+        Parameters
+        ----------
+        x, y : float
+            The coordinates of the point, in the coordinates of the regions.
+
+        Returns
+        -------
+        `~numpy.ndarray`
+            The sorted indices of the matching regions.
+        """
+        return np.sort(self._region_index.query(shapely.Point(x, y), predicate='intersects'))
+
+    def query_bbox(self, xmin, ymin, xmax, ymax):
+        """
+        Find the regions that intersect a given bounding box.
+
+        Parameters
+        ----------
+        xmin, ymin, xmax, ymax : float
+            The limits of the bounding box, in the coordinates of the regions.
+
+        Returns
+        -------
+        `~numpy.ndarray`
+            The sorted indices of the matching regions.
+        """
+        return np.sort(self._region_index.query(shapely.box(xmin, ymin, xmax, ymax), predicate='intersects'))
+
+    def _reset_centers(self):
+        """
+        Update the cached center ComponentIDs from the
+        :class:`~glue.core.component.ExtendedComponent`.
+
+        This needs to be called whenever the extended component, or its
+        ``x`` and ``y`` attributes, are replaced.
+        """
+        if self._extended_component_id is None:
+            self._center_x_id = None
+            self._center_y_id = None
+        else:
+            ext_comp = self.get_component(self._extended_component_id)
+            self._center_x_id = ext_comp.x
+            self._center_y_id = ext_comp.y
+
+    def remove_component(self, component_id):
+        self._equivalent_cid_cache.clear()
+        super().remove_component(component_id)
+        if component_id is self._extended_component_id:
+            self._extended_component_id = None
+            self._reset_centers()
+        elif component_id is self._center_x_id or component_id is self._center_y_id:
+            self._reset_centers()
+
+    def update_id(self, old, new):
+        self._equivalent_cid_cache.clear()
+        super().update_id(old, new)
+
+    def _set_externally_derivable_components(self, derivable_components):
+        self._equivalent_cid_cache.clear()
+        super()._set_externally_derivable_components(derivable_components)
+
+    def _is_equivalent_cid(self, center_cid, target_cid):
+        """
+        Cached version of :func:`~glue.core.link_manager.is_equivalent_cid`.
+
+        The cache is cleared whenever components are added or removed, or the
+        link manager updates the externally derivable components.
+        """
+        from glue.core.link_manager import is_equivalent_cid  # avoid circular import
+
+        key = (center_cid, target_cid)
+        try:
+            return self._equivalent_cid_cache[key]
+        except KeyError:
+            result = self._equivalent_cid_cache[key] = is_equivalent_cid(self, center_cid, target_cid)
+            return result
 
     def _get_trans_to_cids(self, cen_cids, other_cids):
         """
@@ -208,21 +414,26 @@ class RegionData(Data):
 
         funcx = linkx.get_using()
         funcy = linky.get_using()
+        from_x = linkx.get_from_ids()
+        from_y = linky.get_from_ids()
 
-        if len(linkx.get_from_ids()) > 2 or len(linky.get_from_ids()) > 2:
+        if len(from_x) > 2 or len(from_y) > 2:
             raise ValueError("Can only display regions if links depend on 2 or fewer other components.")
 
-        def conv_function(x, y=None):
-            if len(linkx.get_from_ids()) == 1 and len(linky.get_from_ids()) == 1:
+        # Decide on the call signature once here rather than every time the
+        # function is called on the coordinates of a geometry.
+        if len(from_x) == 1 and len(from_y) == 1:
+            def conv_function(x, y=None):
                 return [funcx(x), funcy(y)]
-            else:
+        else:
+            def conv_function(x, y=None):
                 return [funcx(x, y), funcy(x, y)]
 
         self.list_of_functions.append(conv_function)
-        if len(linkx.get_from_ids()) == 2:
-            other_cids = linkx.get_from_ids()
+        if len(from_x) == 2:
+            other_cids = from_x
         else:
-            other_cids = linkx.get_from_ids() + linky.get_from_ids()
+            other_cids = from_x + from_y
         if cen_cids[0] in other_cids or cen_cids[1] in other_cids:
             if set([cen_cids[0]]+[cen_cids[1]]) == set(other_cids):
                 return
@@ -309,18 +520,19 @@ class RegionData(Data):
         bool
             True if target_cid can be mapped to one of the center components, False otherwise.
         """
-        from glue.core.link_manager import is_equivalent_cid  # avoid circular import
+        if self.extended_component_id is None:
+            return False
 
-        center_cids = [self.center_x_id, self.center_y_id]
-        for center_cid in center_cids:
-            if is_equivalent_cid(self, center_cid, target_cid):
-                return True
+        if target_cid is self.center_x_id or target_cid is self.center_y_id:
+            return True
+
+        center_cids = frozenset((self.center_x_id, self.center_y_id))
+        if any(self._is_equivalent_cid(center_cid, target_cid) for center_cid in center_cids):
+            return True
 
         link = self._get_external_link(target_cid)
         if not link:
             return False
-        for center_cid in center_cids:
-            if center_cid in link:
-                return True
-            else:
-                return any([self.linked_to_center_comp(x) for x in link.get_from_ids()])
+        if not center_cids.isdisjoint(link.get_from_ids()):
+            return True
+        return any(self.linked_to_center_comp(x) for x in link.get_from_ids())
@@ -1440,6 +1440,7 @@ def _load_regiondata(rec, context):
                 new_y = comp_id
         ext_comp.x = new_x
         ext_comp.y = new_y
+        ext_data._reset_centers()
     yield fix_special_component_ids(result)
 
 
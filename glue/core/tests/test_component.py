@@ -448,6 +448,15 @@ class TestExtendedComponent(object):
             bad_data = np.array([1, 2, 3])
             bad_data_comp = ExtendedComponent(bad_data, center_comp_ids=[self.cen_x_id, self.cen_y_id])
 
+        with pytest.raises(TypeError, match='Input data for a ExtendedComponent should be a list of shapely.Geometry objects'):
+            bad_data = np.array([Point(0, 0), None], dtype=object)
+            bad_data_comp = ExtendedComponent(bad_data, center_comp_ids=[self.cen_x_id, self.cen_y_id])
+
+        with pytest.raises(TypeError, match='Input data for a ExtendedComponent should be a list of shapely.Geometry objects'):
+            bad_data = np.empty((2, 2), dtype=object)
+            bad_data[:] = [[Point(0, 0), Point(1, 1)], [Point(2, 2), Point(3, 3)]]
+            bad_data_comp = ExtendedComponent(bad_data, center_comp_ids=[self.cen_x_id, self.cen_y_id])
+
         with pytest.raises(ValueError, match='ExtendedComponent must be initialized with one or two ComponentIDs'):
             no_center_ids_comp = ExtendedComponent(self.polys, center_comp_ids=[])
 
@@ -2,6 +2,7 @@ import pytest
 from numpy.testing import assert_array_equal
 
 import numpy as np
+import pandas as pd
 import shapely
 from shapely.geometry import MultiPolygon, Polygon, Point
 from shapely.affinity import affine_transform
@@ -9,8 +10,9 @@ from shapely.ops import transform
 
 from glue.core.data import Data
 from glue.core.data_collection import DataCollection
-from glue.core.data_region import RegionData
+from glue.core.data_region import RegionData, _as_geometry_array
 from glue.core.component import ExtendedComponent
+from glue.core.component_id import ComponentID
 from glue.core.state import GlueUnSerializer
 from glue.core.tests.test_application_base import MockApplication
 from glue.core.link_helpers import LinkSame, LinkTwoWay
@@ -47,6 +49,31 @@ def backwards(x):
     return x / 2
 
 
+def test_as_geometry_array():
+    geoms = _as_geometry_array(SHAPELY_POLYGON_ARRAY)
+    assert geoms is SHAPELY_POLYGON_ARRAY
+
+    geoms = _as_geometry_array(list(SHAPELY_CIRCLE_ARRAY))
+    assert isinstance(geoms, np.ndarray) and geoms.dtype == object
+    assert_array_equal(geoms, SHAPELY_CIRCLE_ARRAY)
+
+    assert _as_geometry_array([]).shape == (0,)
+    assert _as_geometry_array(np.array([], dtype=object)).shape == (0,)
+
+    assert _as_geometry_array(np.array([1, 2, 3])) is None
+    assert _as_geometry_array(np.array([poly_1, None], dtype=object)) is None
+    assert _as_geometry_array([poly_1, 'poly_2']) is None
+    assert _as_geometry_array(np.array([[poly_1, poly_2], [poly_3, poly_4]], dtype=object)) is None
+
+
+def test_empty_geometries():
+    region_data = RegionData(label='My Regions', boundary=[])
+    assert region_data.extended_component_id is region_data.id['boundary']
+    assert region_data.center_x_id is region_data.id['Center [x] for boundary']
+    assert region_data.center_y_id is region_data.id['Center [y] for boundary']
+    assert region_data.size == 0
+
+
 class TestRegionDataLinks(object):
     def setup_method(self):
         self.region_data = RegionData(label='My Regions',
@@ -142,6 +169,83 @@ class TestRegionData(object):
         assert 'Center [x]' in component_labels
         assert 'Center [y]' in component_labels
 
+    def test_centers_from_geometry_list(self):
+        region_data = RegionData(label='My Regions', boundary=list(SHAPELY_POLYGON_ARRAY))
+        rep_points = [g.representative_point() for g in SHAPELY_POLYGON_ARRAY]
+        assert_array_equal(region_data[region_data.center_x_id], [p.x for p in rep_points])
+        assert_array_equal(region_data[region_data.center_y_id], [p.y for p in rep_points])
+        assert_array_equal(region_data['boundary'], SHAPELY_POLYGON_ARRAY)
+
+    def test_from_geometries(self):
+        region_data = RegionData.from_geometries(SHAPELY_POLYGON_ARRAY)
+        assert region_data.shape == SHAPELY_POLYGON_ARRAY.shape
+        assert [cid.label for cid in region_data.components] == [cid.label for cid in self.region_data.components]
+        assert region_data.extended_component_id is region_data.id['boundary']
+        assert region_data.center_x_id is region_data.id['Center [x] for boundary']
+        assert region_data.center_y_id is region_data.id['Center [y] for boundary']
+        assert_array_equal(region_data['boundary'], self.region_data['boundary'])
+        assert_array_equal(region_data[region_data.center_x_id], self.region_data[self.region_data.center_x_id])
+        assert_array_equal(region_data[region_data.center_y_id], self.region_data[self.region_data.center_y_id])
+
+    def test_from_geometries_labels(self):
+        region_data = RegionData.from_geometries(g for g in SHAPELY_POLYGON_ARRAY)
+        assert region_data.label == ''
+        assert_array_equal(region_data['boundary'], SHAPELY_POLYGON_ARRAY)
+
+        region_data = RegionData.from_geometries(SHAPELY_CIRCLE_ARRAY, label='My Regions', boundary_label='circles')
+        assert region_data.label == 'My Regions'
+        assert region_data.extended_component_id is region_data.id['circles']
+        assert region_data.center_x_id is region_data.id['Center [x] for circles']
+
+    def test_from_geometries_empty(self):
+        region_data = RegionData.from_geometries([])
+        assert region_data.size == 0
+        assert region_data.extended_component_id is region_data.id['boundary']
+        assert region_data.center_x_id is region_data.id['Center [x] for boundary']
+
+    def test_from_geometries_invalid(self):
+        with pytest.raises(TypeError, match='geometries should be a one-dimensional iterable'):
+            RegionData.from_geometries([1, 2, 3])
+
+    def test_query_point(self):
+        assert_array_equal(self.region_data.query_point(30, 30), [0])
+        assert_array_equal(self.region_data.query_point(12, 12), [2])
+        assert_array_equal(self.region_data.query_point(0, 0), [])
+        assert_array_equal(self.manual_region_data.query_point(0.5, 0.5), [0, 1])
+
+    def test_query_bbox(self):
+        assert_array_equal(self.region_data.query_bbox(0, 0, 100, 100), [0, 1, 2])
+        assert_array_equal(self.region_data.query_bbox(55, 35, 65, 55), [0, 1])
+        assert_array_equal(self.region_data.query_bbox(90, 90, 100, 100), [])
+
+    def test_query_without_extended_component(self):
+        region_data = RegionData(label='No Regions', x=np.array([1, 2, 3]))
+        with pytest.raises(ValueError, match='RegionData has no extended component'):
+            region_data.query_point(0, 0)
+        with pytest.raises(ValueError, match='RegionData has no extended component'):
+            region_data.query_bbox(0, 0, 1, 1)
+
+    def test_region_index_updated(self):
+        tree = self.region_data._region_index
+        assert self.region_data._region_index is tree
+        self.region_data.update_components({self.region_data.id['boundary']: SHAPELY_POLYGON_ARRAY[::-1]})
+        assert self.region_data._region_index is not tree
+        assert_array_equal(self.region_data.query_point(30, 30), [2])
+
+    def test_add_component_dispatch(self):
+        region_data = RegionData(label='My Regions', boundary=pd.Series(list(SHAPELY_POLYGON_ARRAY)))
+        assert region_data.extended_component_id is region_data.id['boundary']
+        assert_array_equal(region_data['boundary'], SHAPELY_POLYGON_ARRAY)
+
+        cid = region_data.add_component(np.array([1, 2, 3]), label='values')
+        assert_array_equal(region_data[cid], [1, 2, 3])
+
+        with pytest.raises(ValueError, match='Cannot add another ExtendedComponent'):
+            region_data.add_component(ExtendedComponent(SHAPELY_POLYGON_ARRAY,
+                                                        center_comp_ids=[region_data.center_x_id,
+                                                                         region_data.center_y_id]),
+                                      label='other')
+
     def test_get_kind(self):
         assert self.region_data.get_kind('Center [x] for boundary') == 'numerical'
         assert self.region_data.get_kind('Center [y] for boundary') == 'numerical'
@@ -164,6 +268,50 @@ class TestRegionData(object):
         assert self.region_data.linked_to_center_comp(viewer_x_att)
         assert self.region_data.linked_to_center_comp(viewer_y_att)
 
+    def test_check_if_can_display_linked_center_y(self):
+        dc = DataCollection([self.region_data, self.other_data])
+        dc.add_link(LinkTwoWay(self.region_data.center_y_id, self.other_data.id['y'], forwards, backwards))
+
+        assert self.region_data.linked_to_center_comp(self.other_data.id['y'])
+        assert not self.region_data.linked_to_center_comp(self.other_data.id['x'])
+
+    def test_check_if_can_display_center_cids(self):
+        assert self.region_data.linked_to_center_comp(self.region_data.center_x_id)
+        assert self.region_data.linked_to_center_comp(self.region_data.center_y_id)
+        assert not self.region_data.linked_to_center_comp(self.region_data.id['boundary'])
+
+    def test_remove_extended_component(self):
+        center_x_id = self.region_data.center_x_id
+        center_y_id = self.region_data.center_y_id
+        self.region_data.remove_component(self.region_data.extended_component_id)
+        assert self.region_data.extended_component_id is None
+        assert self.region_data.center_x_id is None
+        assert self.region_data.center_y_id is None
+        assert not self.region_data.linked_to_center_comp(center_x_id)
+        assert not self.region_data.linked_to_center_comp(center_y_id)
+
+    def test_check_if_can_display_after_link_removed(self):
+        dc = DataCollection([self.region_data, self.other_data])
+        viewer_x_att = self.other_data.id['x']
+
+        link = LinkSame(self.region_data.center_x_id, viewer_x_att)
+        dc.add_link(link)
+        assert self.region_data.linked_to_center_comp(viewer_x_att)
+
+        dc.remove_link(link)
+        assert not self.region_data.linked_to_center_comp(viewer_x_att)
+
+    def test_equivalent_cid_cache_cleared_on_update_id(self):
+        old = self.region_data.add_component(np.array([1, 2, 3]), label='values')
+        assert self.region_data._is_equivalent_cid(old, old)
+        assert self.region_data._equivalent_cid_cache
+
+        new = ComponentID('new values')
+        self.region_data.update_id(old, new)
+        assert not self.region_data._equivalent_cid_cache
+        assert self.region_data._is_equivalent_cid(new, new)
+        assert not self.region_data._is_equivalent_cid(old, new)
+
     def test_check_if_can_display_through_intermediate(self):
         dc = DataCollection([self.region_data, self.other_data, self.mid_data])
         viewer_x_att = self.other_data.id['x']
@@ -389,6 +537,8 @@ class TestRegionDataSaveRestore(object):
 
             assert data.components[1] == data.get_component(data.components[3]).x
             assert data.components[2] == data.get_component(data.components[3]).y
+            assert data.center_x_id is data.get_component(data.extended_component_id).x
+            assert data.center_y_id is data.get_component(data.extended_component_id).y
 
     def test_links_still_work(self):
         for data in [(self.reg_before, self.cat_before), (self.reg_after, self.cat_after)]: